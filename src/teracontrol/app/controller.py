@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from pathlib import Path
 from datetime import datetime
 from typing import Any
 from PySide6 import QtCore
@@ -149,6 +148,7 @@ class AppController(QtCore.QObject):
         return self._presets
     
     def cleanup(self) -> None:
+        self._stop_worker_thread()
         self._registry.disconnect_all()
         self._cleanup_experiment()
 
@@ -186,6 +186,7 @@ class AppController(QtCore.QObject):
     # Experiment API
     # ------------------------------------------------------------------
 
+    @QtCore.Slot(dict, result=bool)
     def run_experiment(self, config: dict[str, Any]) -> bool:
         if self._experiment_running():
             log.warning("Experiment already running")
@@ -213,15 +214,18 @@ class AppController(QtCore.QObject):
             self._cleanup_experiment()
             return False
         
+    @QtCore.Slot(result=bool)
     def abort_experiment(self) -> bool:
         return self._forward_worker_call("abort")
 
+    @QtCore.Slot(result=bool)
     def pause_experiment(self) -> bool:
         ok = self._forward_worker_call("pause")
         if ok:
             self._set_status(ExperimentStatus.PAUSED)
         return ok
     
+    @QtCore.Slot(result=bool)
     def resume_experiment(self) -> bool:
         ok = self._forward_worker_call("resume")
         if ok:
@@ -283,14 +287,20 @@ class AppController(QtCore.QObject):
 
         self._thread.started.connect(self._worker.run)
             
+        # Worker signals cross threads: queue them explicitly and chain
+        # them straight into the controller signals (no Python relay)
+        queued = QtCore.Qt.QueuedConnection
         signals = self._worker.signals
-        signals.run_progress.connect(self._on_run_progress)
-        signals.step_progress.connect(self._on_step_progress)
-        signals.data_ready.connect(self._on_data_ready)
+        signals.run_progress.connect(self.run_progress, queued)
+        signals.step_progress.connect(self.step_progress, queued)
+        signals.data_ready.connect(self.data_ready, queued)
         signals.data_ready.connect(
             lambda atom, _: self._writer.write(atom.index, atom)
         )
-        signals.step_finished.connect(self._on_step_finished)
+        signals.step_finished.connect(self.step_finished, queued)
+        signals.step_finished.connect(
+            lambda *_: self._writer.checkpoint()
+        )
 
         signals.started.connect(
             lambda _: self._set_status(ExperimentStatus.RUNNING)
@@ -332,6 +342,28 @@ class AppController(QtCore.QObject):
         self._set_status(ExperimentStatus.IDLE)
         log.debug("Experiment state cleaned up")
 
+    def _stop_worker_thread(self, timeout_ms: int = 5000) -> None:
+        """
+        Abort a running sweep and join its thread before shutdown.
+        """
+        try:
+            running = self._thread is not None and self._thread.isRunning()
+        except RuntimeError:  # thread object already deleted
+            running = False
+
+        if not running:
+            return
+
+        if self._worker is not None:
+            self._worker.abort()
+            self._worker.resume()  # release a paused sweep
+
+        self._thread.quit()
+        if not self._thread.wait(timeout_ms):
+            log.warning(
+                "Experiment thread did not stop within %d ms", timeout_ms
+            )
+
     def _forward_worker_call(self, method: str) -> bool:
         if not self._experiment_running():
             log.warning("Experiment not running")
@@ -339,19 +371,3 @@ class AppController(QtCore.QObject):
         
         getattr(self._worker, method)()
         return True
-
-    # ------------------------------------------------------------------
-    # Slots
-    # ------------------------------------------------------------------
-
-    def _on_data_ready(self, data: DataAtom, meta: dict[str, Any]) -> None:
-        self.data_ready.emit(data, meta)
-
-    def _on_step_finished(self, index: int, total: int) -> None:
-        self.step_finished.emit(index, total)
-
-    def _on_step_progress(self, current: int, total: int, message: str) -> None:
-        self.step_progress.emit(current, total, message)
-
-    def _on_run_progress(self, current: int, total: int) -> None:
-        self.run_progress.emit(current, total)
\ No newline at end of file
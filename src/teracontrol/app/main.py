@@ -4,10 +4,6 @@ from pathlib import Path
 from datetime import datetime
 from PySide6 import QtWidgets
 
-from teracontrol.core.instruments import InstrumentRegistry
-from teracontrol.app.context import AppContext
-from teracontrol.app.controller import AppController
-from teracontrol.gui.main_window import MainWindow
 from teracontrol.utils.logging import setup_logging, get_logger
 
 log = get_logger(__name__)
@@ -29,6 +25,13 @@ def main() -> None:
     try:
         app = QtWidgets.QApplication(sys.argv)
 
+        # Heavy imports (numpy/scipy/h5py/pyqtgraph) are deferred until
+        # logging and the QApplication are up, so failures get logged
+        from teracontrol.core.instruments import InstrumentRegistry
+        from teracontrol.app.context import AppContext
+        from teracontrol.app.controller import AppController
+        from teracontrol.gui.main_window import MainWindow
+
         registry = InstrumentRegistry()
         context = AppContext(
             root_dir=PACKAGE_ROOT,
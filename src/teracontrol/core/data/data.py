@@ -1,26 +1,37 @@
 from dataclasses import dataclass
+from functools import lru_cache
 import numpy as np
 from datetime import datetime
 from typing import Any, Callable
-from scipy.fft import fft, fftfreq
+from scipy.fft import rfft, rfftfreq
 
 
 # =============================================================================
 # Payload
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Waveform:
     time: np.ndarray
     signal: np.ndarray
 
+    def __post_init__(self) -> None:
+        # Store contiguous buffers once so consumers never need to copy;
+        # the signal keeps its source precision
+        object.__setattr__(
+            self, "time", np.ascontiguousarray(self.time, dtype=np.float64)
+        )
+        object.__setattr__(
+            self, "signal", np.ascontiguousarray(self.signal)
+        )
+
     def to_dict(self) -> dict[str, np.ndarray]:
         return {
             "time": self.time,
             "signal": self.signal,
         }
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WaveSpectrum:
     freq: np.ndarray
     amp: np.ndarray
@@ -33,7 +44,16 @@ class WaveSpectrum:
             "phase": self.phase,
         }
 
-# --- FFT helper ---
+# --- FFT helpers ---
+
+@lru_cache(maxsize=32)
+def _positive_freqs(n: int, dt: float) -> np.ndarray:
+    """Read-only frequency axis of an n-point FFT, shared between spectra."""
+    # float32 like the amplitudes: spectra only feed the plots
+    freq = rfftfreq(n, dt)[:n//2].astype(np.float32)
+    freq.flags.writeable = False
+    return freq
+
 
 def waveform_to_wavespectrum(
     waveform: Waveform,
@@ -45,15 +65,19 @@ def waveform_to_wavespectrum(
     else:
         _signal = waveform.signal
 
+    # float32 is enough here: spectra only feed the plots
+    _signal = _signal.astype(np.float32, copy=False)
+
     # zero padding
     if length is not None:
         _len = length
     else:
         _len = len(_signal)
 
-    _dt = waveform.time[1] - waveform.time[0]
-    _fft = fft(_signal, n=_len)[:_len//2]
-    _freq = fftfreq(_len, _dt)[:_len//2]
+    # Real input: rfft computes only the positive half of the spectrum
+    _dt = float(waveform.time[1] - waveform.time[0])
+    _fft = rfft(_signal, n=_len)[:_len//2]
+    _freq = _positive_freqs(_len, _dt)
     _amp = np.abs(_fft)
     _phase = np.unwrap(np.angle(_fft))
     
@@ -63,11 +87,43 @@ def waveform_to_wavespectrum(
         phase=_phase,
     )
 
+def waveforms_to_wavespectra(
+    waveforms: list[Waveform],
+    t_cut: float | None = None,
+    length: int | None = None,
+) -> list[WaveSpectrum]:
+    """
+    Spectra of several waveforms; one 2-D FFT when they share a time axis.
+    """
+    if len(waveforms) < 2:
+        return [waveform_to_wavespectrum(wf, t_cut, length) for wf in waveforms]
+
+    time = waveforms[0].time
+    if not all(np.array_equal(wf.time, time) for wf in waveforms[1:]):
+        return [waveform_to_wavespectrum(wf, t_cut, length) for wf in waveforms]
+
+    _signals = np.stack([wf.signal for wf in waveforms], dtype=np.float32)
+    if t_cut is not None:
+        _signals = _signals[:, time < t_cut]
+
+    _len = length if length is not None else _signals.shape[1]
+
+    _dt = float(time[1] - time[0])
+    _fft = rfft(_signals, n=_len, axis=1)[:, :_len//2]
+    _freq = _positive_freqs(_len, _dt)
+    _amp = np.abs(_fft)
+    _phase = np.unwrap(np.angle(_fft), axis=1)
+
+    return [
+        WaveSpectrum(freq=_freq, amp=_amp[i], phase=_phase[i])
+        for i in range(len(waveforms))
+    ]
+
 # =============================================================================
 # Data Atom
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataAtom:
     timestamp: datetime
     status: dict[str, Any]
@@ -78,19 +78,19 @@ class ExperimentWorker(QtCore.QObject):
         Sleep cooperatively, allowing pause and abort.
         Returns False if aborted, True otherwise.
         """
-        remaining = total_ms
-        elapsed = 0
+        # Sleep towards an absolute monotonic deadline, so scheduler
+        # oversleep and signal overhead do not accumulate into drift.
+        t0 = time.monotonic()
+        deadline = t0 + total_ms / 1000
 
-        while remaining > 0:
+        while (remaining_s := deadline - time.monotonic()) > 0:
             if self._abort:
                 return False
             
-            step = min(self._SLEEP_QUANTUM_MS, remaining)
+            step = min(self._SLEEP_QUANTUM_MS, max(1, int(remaining_s * 1000)))
             QtCore.QThread.msleep(step)
 
-            remaining -= step
-            elapsed += step
-
+            elapsed = min(total_ms, int((time.monotonic() - t0) * 1000))
             self.signals.step_progress.emit(elapsed, total_ms, "waiting...")
 
         return True
@@ -130,6 +130,8 @@ class ExperimentWorker(QtCore.QObject):
 
         if axis.blocking:
             timeout_s = axis.estimate_settle_time_s(value)
+            timeout_ms = int(timeout_s * 1000)
+            message = f"{axis.name}: stabilizing..."  # built once per step
             t0 = time.monotonic()
 
             while not axis.is_ready():
@@ -146,9 +148,7 @@ class ExperimentWorker(QtCore.QObject):
                 )
                 
                 self.signals.step_progress.emit(
-                    int(elapsed_s * 1000),
-                    int(timeout_s * 1000),
-                    f"{axis.name}: stabilizing...",
+                    int(elapsed_s * 1000), timeout_ms, message
                 )
 
                 QtCore.QThread.msleep(self._SLEEP_QUANTUM_MS)
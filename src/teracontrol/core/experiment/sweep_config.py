@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Iterable
+
+import numpy as np
 
 from .sweep_axis import SweepAxis
 
@@ -32,27 +34,22 @@ class SweepConfig:
                 "Sweep step sign does not move start toward stop"
             )
         
-    def points(self) -> Iterable[float]:
+    def points(self) -> list[float]:
         """
         Generate sweep points including start and stop.
-        """
-        x = self.start
-        eps = abs(self.step) * 1e-12
 
-        if self.step > 0:
-            while x <= self.stop + eps:
-                yield x
-                x += self.step
-        else:
-            while x >= self.stop - eps:
-                yield x
-                x += self.step
+        Each point is computed as start + i*step, so roundoff does not
+        accumulate along the sweep.
+        """
+        return (np.arange(self.npoints()) * self.step + self.start).tolist()
 
     def npoints(self) -> int:
         """
         Total number of points in the sweep.
         """
-        return sum(1 for _ in self.points())
+        # Tolerance keeps a stop that lies on the grid from being lost
+        # to roundoff in the division
+        return math.floor((self.stop - self.start) / self.step + 1e-12) + 1
 
     def describe(self) -> dict:
         """
@@ -1,15 +1,18 @@
-from dataclasses import dataclass
+from typing import Final
 
 
 # =============================================================================
 # Instrument Catalog
 # =============================================================================
 
-@dataclass(frozen=True)
 class InstrumentCatalog:
-    THZ = "TeraFlash"
-    TEMP = "ITC"
-    FIELD = "IPS"
+    """
+    Namespace of registered instrument names (not meant to be instantiated).
+    """
+
+    THZ: Final[str] = "TeraFlash"
+    TEMP: Final[str] = "ITC"
+    FIELD: Final[str] = "IPS"
 
 # =============================================================================
 # Instrument Defaults
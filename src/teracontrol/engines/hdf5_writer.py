@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import re
+import queue
+import threading
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Any
@@ -10,19 +13,34 @@ import json
 import numpy as np
 
 from teracontrol.core.data import DataAtom
+from teracontrol.utils.logging import get_logger
+
+try:
+    import hdf5plugin  # optional: Blosc/LZ4 filters
+except ImportError:
+    hdf5plugin = None
+
+log = get_logger(__name__)
 
 
 # =============================================================================
 # Helpers
 # =============================================================================
 
+_WS_RE = re.compile(r"\s+")
+_BAD_RE = re.compile(r"[^\w\.]")
+
+
+@lru_cache(maxsize=4096)
 def normalize_key(key: str) -> str:
     """
     Normalize a key to be HDF5-safe.
+
+    Results are memoized: metadata dicts repeat the same keys run after run.
     """
     key = key.strip()
-    key = re.sub(r"\s+", "_", key)  # spaces -> underscores
-    key = re.sub(r"[^\w\.]", "", key)  # drop weird chars
+    key = _WS_RE.sub("_", key)  # spaces -> underscores
+    key = _BAD_RE.sub("", key)  # drop weird chars
     return key
 
 
@@ -32,22 +50,106 @@ def flatten_dict(
     separator: str = ".",
 ) -> dict[str, Any]:
     """
-    Recursively flatten a nested dictionary.
+    Flatten a nested dictionary.
+
+    Walks the nesting with an explicit stack of iterators instead of
+    recursion, keeping the depth-first key order.
     """
     out: dict[str, Any] = {}
+    stack = [(prefix, iter(data.items()))]
 
-    for key, value in data.items():
-        norm = normalize_key(key)
-        full = f"{prefix}{separator}{norm}" if prefix else norm
+    while stack:
+        parent, items = stack[-1]
+
+        for key, value in items:
+            norm = normalize_key(key)
+            full = f"{parent}{separator}{norm}" if parent else norm
+
+            if isinstance(value, dict):
+                stack.append((full, iter(value.items())))
+                break
 
-        if isinstance(value, dict):
-            out.update(flatten_dict(value, full, separator))
-        else:
             out[full] = value
+        else:
+            stack.pop()
 
     return out
 
 
+def is_uniform(
+    time: np.ndarray,
+    t0: float,
+    dt: float,
+    rtol: float = 1e-9,
+) -> bool:
+    """
+    Return True if time follows t(n) = t0 + dt*n within rtol.
+
+    Checks the first sample and then the sample spacing in a single
+    in-place reduction, without building the reference axis.
+    """
+    tol = rtol * max(abs(time[0]), abs(time[-1]))
+
+    if abs(time[0] - t0) > tol:
+        return False
+
+    if len(time) < 2:
+        return True
+
+    steps = np.diff(time)
+    np.subtract(steps, dt, out=steps)
+    np.abs(steps, out=steps)
+    return bool(steps.max() <= tol)
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Fallback for dumps(): NumPy values as plain Python, anything else
+    as str().
+    """
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    return str(value)
+
+
+def dumps(value: Any) -> str:
+    """
+    Encode a value as compact JSON.
+
+    NumPy scalars and arrays are written as numbers and lists. NaN and
+    infinities are kept as NaN/Infinity, which Python's json reads back.
+    Other objects JSON cannot represent are encoded with str().
+    """
+    return json.dumps(
+        value,
+        default=_json_default,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+def signal_compression() -> dict[str, Any]:
+    """
+    Compression filter options for the signal table.
+
+    Blosc/LZ4 (multithreaded, releases the GIL) when hdf5plugin is
+    installed, gzip otherwise. Reading Blosc-compressed files also
+    requires hdf5plugin to be imported.
+    """
+    if hdf5plugin is not None:
+        return dict(hdf5plugin.Blosc(
+            cname="lz4",
+            clevel=3,
+            shuffle=hdf5plugin.Blosc.SHUFFLE,
+        ))
+
+    return {
+        "compression": "gzip",
+        "compression_opts": 4,
+        "shuffle": True,
+    }
+
+
 def write_attr(attrs: h5py.AttributeManager, key: str, value: Any) -> None:
     """
     Write an HDF5-safe attribute.
@@ -71,7 +173,7 @@ def write_attr(attrs: h5py.AttributeManager, key: str, value: Any) -> None:
     else:
         attrs.create(
             key,
-            json.dumps(value),
+            dumps(value),
             dtype=h5py.string_dtype(encoding="utf-8"),
         )
 
@@ -80,29 +182,73 @@ def write_attr(attrs: h5py.AttributeManager, key: str, value: Any) -> None:
 # HDF5 writer
 # =============================================================================
 
+_STOP = object()        # drain-thread sentinel
+_CHECKPOINT = object()  # flush request, see HDF5RunWriter.checkpoint()
+
+
 class HDF5RunWriter:
     """
     Live HDF5 writer for a single experiment run.
 
+    Every DataAtom becomes one row of a set of extensible datasets, so the
+    whole run shares a single chunked, compressed signal table.
+
+    write() only validates the atom and queues it; a background thread
+    drains the queue and appends whatever has accumulated in one batch,
+    keeping compression and disk I/O off the acquisition thread. The file
+    is flushed only at checkpoint() boundaries and on close().
+
     Layout:
 
     /run
         attrs (experiment-level metadata)
         /data
-            data_00000  (dataset: signal)
-                attrs (data-level metadata)
-            data_00001  (dataset: signal)
-                attrs (data-level metadata)
-            ...
+            signal        (N, nt) dtype (float32 by default), one waveform
+                          per row
+                attrs (signal unit and shared time axis t0/dt/nt)
+            time          (N, nt) float64, explicit axis of non-uniform
+                          rows (NaN elsewhere); only created if needed
+            meta          (N,) compound, one record per row:
+                index         DataAtom index
+                timestamp     acquisition timestamp
+                time_uniform  True if the row matches the shared time axis
+                status        JSON-encoded status snapshot
     """
 
-    def __init__(self, path: Path, flush_every: int = 1):
+    CHUNK_BYTES = 1_000_000  # target size of one signal chunk (~1 MB)
+    META_CHUNK_ROWS = 512  # meta records per chunk (~20 kB)
+    RDCC_NSLOTS = 101  # chunk-cache hash slots per row table (prime)
+
+    def __init__(
+        self,
+        path: Path,
+        queue_size: int = 128,
+        assume_uniform_time: bool = True,
+        dtype: np.dtype | type = np.float32,
+    ):
         self._path = Path(path)
         self._file: h5py.File | None = None
         self._run: h5py.Group | None = None
         self._data: h5py.Group | None = None
 
-        self._flush_every = flush_every
+        # --- Row datasets (created on the first atom) ---
+        self._signal: h5py.Dataset | None = None
+        self._dtype = np.dtype(dtype)
+        self._meta: h5py.Dataset | None = None
+        self._time: h5py.Dataset | None = None
+        self._indices: set[int] = set()
+
+        # --- Shared time axis ---
+        self._t0 = 0.0
+        self._dt = 0.0
+        self._nt = 0
+        self._assume_uniform_time = assume_uniform_time
+
+        # --- Background drain ---
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+
         self._counter = 0
 
     # --------------------------------------------------------------------------
@@ -126,7 +272,8 @@ class HDF5RunWriter:
         user_meta: dict[str, Any],
     ) -> None:
         """
-        Create the HDF5 file and write run-level metadata.
+        Create the HDF5 file, write run-level metadata and start the
+        drain thread.
         """
         self._file = h5py.File(self._path, "w", libver="latest")
         self._run = self._file.create_group("run")
@@ -142,19 +289,78 @@ class HDF5RunWriter:
         for k, v in flatten_dict(user_meta, prefix="user").items():
             write_attr(attrs, k, v)
 
+        self._thread = threading.Thread(
+            target=self._drain,
+            name=f"HDF5RunWriter[{self._path.name}]",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _create_datasets(self) -> None:
+        """
+        Create the row datasets once the waveform length is known.
+        """
+        nt = self._nt
+
+        row_bytes = nt * self._dtype.itemsize
+        rows_per_chunk = max(1, self.CHUNK_BYTES // row_bytes)
+        self._signal = self._data.create_dataset(
+            "signal",
+            shape=(0, nt),
+            maxshape=(None, nt),
+            dtype=self._dtype,
+            chunks=(rows_per_chunk, nt),
+            **signal_compression(),
+            **self._chunk_cache(rows_per_chunk * row_bytes),
+        )
+
+        # Data metadata
+        attrs = self._signal.attrs
+        write_attr(attrs, "data.unit", "nA")
+
+        # Time metadata
+        write_attr(attrs, "time.unit", "ps")
+        write_attr(attrs, "time.t0", self._t0)
+        write_attr(attrs, "time.dt", self._dt)
+        write_attr(attrs, "time.nt", nt)
+        write_attr(attrs, "time.encoding", "uniform:t(n)=t0+dt*n")
+
+        # Per-row metadata, one compound record per atom
+        text = h5py.string_dtype(encoding="utf-8")
+        meta_dtype = np.dtype([
+            ("index", np.int64),
+            ("timestamp", text),
+            ("time_uniform", np.bool_),
+            ("status", text),
+        ])
+        self._meta = self._data.create_dataset(
+            "meta",
+            shape=(0,),
+            maxshape=(None,),
+            dtype=meta_dtype,
+            chunks=(self.META_CHUNK_ROWS,),
+        )
+
     # --------------------------------------------------------------------------
     # Writing
     # --------------------------------------------------------------------------
 
     def write(self, index: int, atom: DataAtom) -> None:
         """
-        Write a single DataAtom as one dataset.
+        Validate a single DataAtom and queue it as one row.
+
+        The payload arrays are queued by reference (converted only if their
+        dtype differs), so they must not be modified after this call.
+        Waveform payloads are frozen and never mutated. Blocks only if the
+        drain thread has fallen queue_size atoms behind.
         """
-        if self._data is None:
+        if self._thread is None:
             raise RuntimeError("Writer not opened")
 
-        name = f"data_{index:05d}"
-        if name in self._data:
+        if self._error is not None:
+            raise RuntimeError("HDF5 drain thread failed") from self._error
+
+        if index in self._indices:
             raise RuntimeError(f"Duplicate DataAtom index {index}")
 
         payload = atom.payload
@@ -163,8 +369,8 @@ class HDF5RunWriter:
         if "signal" not in arrays or "time" not in arrays:
             raise ValueError("Payload must provide 'signal'and 'time'")
         
-        signal = np.asarray(arrays["signal"])
-        time = np.asarray(arrays["time"])
+        signal = np.ascontiguousarray(arrays["signal"], dtype=self._dtype)
+        time = np.asarray(arrays["time"], dtype=np.float64)
 
         if signal.ndim != 1 or time.ndim != 1:
             raise ValueError("Signal and time must be 1D arrays")
@@ -172,51 +378,161 @@ class HDF5RunWriter:
         if len(signal) != len(time):
             raise ValueError("Signal and time must have the same length")
         
-        # Deterministic time encoding (instrument contract)
-        t0 = float(time[0])
-        dt = float(time[1] - time[0]) if len(time) > 1 else 0.0
         nt = signal.shape[0]
 
-        # Non-blocking uniformity check (record only)
-        time_uniform = True
-        if len(time) > 2:
-            time_uniform = np.allclose(
-                time,
-                t0 + dt * np.arange(len(time)),
-                rtol=1e-9,
-                atol=0.0,
+        if self._nt == 0:
+            # Deterministic time encoding (instrument contract)
+            self._t0 = float(time[0])
+            self._dt = float(time[1] - time[0]) if nt > 1 else 0.0
+            self._nt = nt
+
+        elif nt != self._nt:
+            raise ValueError(
+                f"Signal length {nt} does not match run length {self._nt}"
             )
-        
-        # Create the dataset
-        dset = self._data.create_dataset(
-            name,
-            data=signal,
-            chunks=True,
-            compression="gzip",
-            compression_opts=4,
-            shuffle=True,
+
+        self._indices.add(index)
+
+        item = (index, atom, signal, time)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            log.warning(
+                "HDF5 write queue full (%d atoms); acquisition is waiting "
+                "for the disk",
+                self._queue.maxsize,
+            )
+            self._queue.put(item)
+
+    def checkpoint(self) -> None:
+        """
+        Request a file flush once all atoms queued so far are written.
+
+        Meant for natural boundaries such as the end of a sweep step.
+        """
+        if self._thread is not None:
+            self._queue.put(_CHECKPOINT)
+
+    def _drain(self) -> None:
+        """
+        Drain-thread loop: append queued atoms in batches until stopped.
+        """
+        stop = False
+
+        while not stop:
+            items = [self._queue.get()]
+
+            # Take everything that piled up while the last batch was written
+            while items[-1] is not _STOP:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = items[-1] is _STOP
+            flush = any(item is _CHECKPOINT for item in items)
+            batch = [
+                item for item in items
+                if item is not _STOP and item is not _CHECKPOINT
+            ]
+
+            if self._error is not None:
+                continue
+
+            try:
+                if batch:
+                    self._append_rows(batch)
+                if flush:
+                    self._file.flush()
+            except BaseException as exc:
+                log.error("HDF5 write failed", exc_info=True)
+                self._error = exc
+
+    def _check_uniform(self, time: np.ndarray) -> bool:
+        """
+        Check a row against the shared time axis.
+
+        With assume_uniform_time only the first two samples are compared,
+        which catches a shifted or rescaled axis without a full pass.
+        """
+        if self._assume_uniform_time:
+            return is_uniform(time[:2], self._t0, self._dt)
+
+        return is_uniform(time, self._t0, self._dt)
+
+    def _chunk_cache(self, chunk_bytes: int) -> dict[str, Any]:
+        """
+        Chunk-cache options for a row table with chunks of chunk_bytes.
+
+        Rows are only appended, so at most the partially filled chunk and
+        the one a batch spills into are live. Keeping them resident means
+        an append never re-reads and recompresses a chunk. w0=1.0 evicts
+        fully written chunks first.
+        """
+        return {
+            "rdcc_nbytes": 2 * chunk_bytes,
+            "rdcc_nslots": self.RDCC_NSLOTS,
+            "rdcc_w0": 1.0,
+        }
+
+    def _create_time_dataset(self) -> None:
+        """
+        Create the explicit time table for rows off the shared axis.
+        """
+        nt = self._nt
+
+        rows_per_chunk = max(1, self.CHUNK_BYTES // (nt * 8))
+        self._time = self._data.create_dataset(
+            "time",
+            shape=(self._counter, nt),
+            maxshape=(None, nt),
+            dtype=np.float64,
+            chunks=(rows_per_chunk, nt),
+            fillvalue=np.nan,
+            **signal_compression(),
+            **self._chunk_cache(rows_per_chunk * nt * 8),
         )
+        write_attr(self._time.attrs, "time.unit", "ps")
 
-        # Data metadata
-        write_attr(dset.attrs, "data.index", index)
-        write_attr(dset.attrs, "data.timestamp", atom.timestamp)
-        write_attr(dset.attrs, "data.unit", "nA")
-        
-        # Time metadata
-        write_attr(dset.attrs, "time.unit", "ps")
-        write_attr(dset.attrs, "time.t0", t0)
-        write_attr(dset.attrs, "time.dt", dt)
-        write_attr(dset.attrs, "time.nt", signal.shape[0])
-        write_attr(dset.attrs, "time.encoding", "uniform:t(n)=t0+dt*n")
-        write_attr(dset.attrs, "time.uniform", time_uniform)
-
-        # Status metadata
-        for k, v in flatten_dict(atom.status, prefix="status").items():
-            write_attr(dset.attrs, k, v)
-
-        self._counter += 1
-        if self._counter % self._flush_every == 0:
-            self._file.flush()
+    def _append_rows(self, batch: list[tuple]) -> None:
+        """
+        Append a batch of validated atoms with one resize per dataset.
+        """
+        if self._signal is None:
+            self._create_datasets()
+
+        start = self._counter
+        stop = start + len(batch)
+
+        records = np.empty(len(batch), dtype=self._meta.dtype)
+        for i, (index, atom, _, time) in enumerate(batch):
+            records[i] = (
+                index,
+                str(atom.timestamp),
+                self._check_uniform(time),
+                dumps(atom.status),
+            )
+
+        # Write each row straight from its own buffer instead of first
+        # copying the batch into a stacked array
+        self._signal.resize(stop, axis=0)
+        for i, (_, _, signal, _) in enumerate(batch):
+            self._signal.write_direct(signal, dest_sel=np.s_[start + i, :])
+
+        self._meta.resize((stop,))
+        self._meta[start:stop] = records
+
+        # Explicit axis only for rows off the shared one
+        irregular = np.flatnonzero(~records["time_uniform"])
+        if len(irregular) and self._time is None:
+            self._create_time_dataset()
+
+        if self._time is not None:
+            self._time.resize(stop, axis=0)
+            for i in irregular:
+                self._time[start + i] = batch[i][3]
+
+        self._counter = stop
 
     # --------------------------------------------------------------------------
     # Finalization
@@ -224,8 +540,16 @@ class HDF5RunWriter:
 
     def close(self, status: str = "completed") -> None:
         """
-        Finalize and close the HDF5 file.
+        Drain pending atoms, then finalize and close the HDF5 file.
         """
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+        if self._error is not None and status == "completed":
+            status = "failed"
+
         if self._run is not None:
             write_attr(self._run.attrs, "run.status", status)
             write_attr(
@@ -241,5 +565,8 @@ class HDF5RunWriter:
         self._file = None
         self._run = None
         self._data = None
+        self._signal = None
+        self._meta = None
+        self._time = None
 
-    
\ No newline at end of file
+    
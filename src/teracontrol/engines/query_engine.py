@@ -15,9 +15,9 @@ class QueryEngine:
         try:
             inst = self._registry.get(name)
             response = inst.query(cmd)
-            log.info(f"Query response: {name} -> {cmd} -> {response}")
+            log.info("Query response: %s -> %s -> %s", name, cmd, response)
             return response
         
         except Exception:
-            log.error(f"Failed to query {name}: {cmd}", exc_info=True)
+            log.error("Failed to query %s: %s", name, cmd, exc_info=True)
             return f"Failed to query {name}: {cmd}"
\ No newline at end of file
@@ -22,6 +22,9 @@ class ExperimentControlWidget(QtWidgets.QWidget):
         super().__init__()
 
         self._axis_catalogue = axis_catalog or {}
+        self._last_state: ExperimentStatus | None = None
+        self._prog_max = -1
+        self._step_max = -1
 
         self._build_widgets()
         self._setup_layout()
@@ -57,16 +60,15 @@ class ExperimentControlWidget(QtWidgets.QWidget):
         self._abort = QtWidgets.QPushButton("Abort")
         self._progress = QtWidgets.QProgressBar()
 
-        self._top_widget = self._build_top_widget()
+        self._top_layout = self._build_top_layout()
         self._pars_group = self._build_pars_group()
         self._meta_group = self._build_meta_group()
-        self._bottom_widget = self._build_bottom_widget()
+        self._bottom_layout = self._build_bottom_layout()
         
-    def _build_top_widget(self) -> QtWidgets.QWidget:
-        w = QtWidgets.QWidget()
-        layout = QtWidgets.QFormLayout(w)
+    def _build_top_layout(self) -> QtWidgets.QLayout:
+        layout = QtWidgets.QFormLayout()
         layout.addRow("Axis", self._axis_dropdown)
-        return w
+        return layout
 
     def _build_pars_group(self) -> QtWidgets.QWidget:
         box = QtWidgets.QGroupBox("Parameters")
@@ -99,9 +101,8 @@ class ExperimentControlWidget(QtWidgets.QWidget):
         layout.addRow("Comment", self._comment)
         return box
 
-    def _build_bottom_widget(self) -> QtWidgets.QWidget:
-        w = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(w)
+    def _build_bottom_layout(self) -> QtWidgets.QLayout:
+        layout = QtWidgets.QVBoxLayout()
         layout.addWidget(self._step_progress)
         sub_layout = QtWidgets.QHBoxLayout()
         sub_layout.addWidget(self._run)
@@ -110,14 +111,14 @@ class ExperimentControlWidget(QtWidgets.QWidget):
         sub_layout.addStretch(1)
         sub_layout.addWidget(self._progress)
         layout.addLayout(sub_layout)
-        return w
+        return layout
 
     def _setup_layout(self) -> None:
         layout = QtWidgets.QVBoxLayout(self)
-        layout.addWidget(self._top_widget)
+        layout.addLayout(self._top_layout)
         layout.addWidget(self._pars_group)
         layout.addWidget(self._meta_group)
-        layout.addWidget(self._bottom_widget)
+        layout.addLayout(self._bottom_layout)
 
     def _preconfigure_widgets(self) -> None:
         if self._axis_catalogue:
@@ -149,13 +150,9 @@ class ExperimentControlWidget(QtWidgets.QWidget):
         )
 
     def _wire_signals(self) -> None:
-        self._run.clicked.connect(
-            lambda: self.run_requested.emit(self.current_config())
-        )
+        self._run.clicked.connect(self._on_run_clicked)
         self._pause.clicked.connect(self._on_pause_clicked)
-        self._abort.clicked.connect(
-            lambda: self.abort_requested.emit()
-        )
+        self._abort.clicked.connect(self._on_abort_clicked)
         self._axis_dropdown.currentTextChanged.connect(
             self._on_axis_selected
         )
@@ -164,12 +161,22 @@ class ExperimentControlWidget(QtWidgets.QWidget):
     # UI -> Controller intent
     # ------------------------------------------------------------------
 
-    def _on_pause_clicked(self) -> None:
+    @QtCore.Slot(bool)
+    def _on_run_clicked(self, _checked: bool = False) -> None:
+        self.run_requested.emit(self.current_config())
+
+    @QtCore.Slot(bool)
+    def _on_pause_clicked(self, _checked: bool = False) -> None:
         if self._pause.text() == "Pause":
             self.pause_requested.emit()
         else:
             self.resume_requested.emit()
 
+    @QtCore.Slot(bool)
+    def _on_abort_clicked(self, _checked: bool = False) -> None:
+        self.abort_requested.emit()
+
+    @QtCore.Slot(str)
     def _on_axis_selected(self, axis_name: str) -> None:
         self._update_axis(axis_name)
 
@@ -178,10 +185,14 @@ class ExperimentControlWidget(QtWidgets.QWidget):
     # ------------------------------------------------------------------
 
     def set_state(self, status: ExperimentStatus) -> None:
+        if status == self._last_state:
+            return  # nothing to re-enable or relabel
+        self._last_state = status
+
         idle = status in (ExperimentStatus.IDLE, ExperimentStatus.ERROR)
         paused = status is ExperimentStatus.PAUSED
 
-        self._top_widget.setEnabled(idle)
+        self._axis_dropdown.setEnabled(idle)
         self._pars_group.setEnabled(idle)
         self._meta_group.setEnabled(idle)
         
@@ -192,11 +203,15 @@ class ExperimentControlWidget(QtWidgets.QWidget):
         self._pause.setText("Resume" if paused else "Pause")
 
     def set_progress(self, current: int, total: int) -> None:
-        self._progress.setMaximum(total)
+        if total != self._prog_max:
+            self._progress.setMaximum(total)
+            self._prog_max = total
         self._progress.setValue(current)
 
     def set_step_progress(self, current: int, total: int, message: str) -> None:
-        self._step_progress.setMaximum(total)
+        if total != self._step_max:
+            self._step_progress.setMaximum(total)
+            self._step_max = total
         self._step_progress.setValue(current)
         self._step_progress.setFormat(message)
 
@@ -221,10 +236,17 @@ class ExperimentControlWidget(QtWidgets.QWidget):
         minimum = axis_cls.minimum
         maximum = axis_cls.maximum
 
+        suffix = f" {unit}"
+
         for spinbox in (self._start, self._stop, self._step):
+            spinbox.setUpdatesEnabled(False)
+
+            # Decimals first: setRange() rounds the bounds to them
             spinbox.setDecimals(decimals)
-            spinbox.setSuffix(f" {unit}")
+            spinbox.setSuffix(suffix)
             spinbox.setRange(minimum, maximum)
+
+            spinbox.setUpdatesEnabled(True)
         
         self.axis_selected.emit(axis_name)
 
@@ -1,34 +1,51 @@
+from dataclasses import dataclass
 from typing import Any
-from PySide6 import QtWidgets, QtCore
+from PySide6 import QtWidgets, QtCore, QtGui
 from teracontrol.utils.logging import get_logger
 
 log = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class _Row:
+    """Widgets and state of one instrument row."""
+    edit: QtWidgets.QLineEdit
+    button: QtWidgets.QPushButton
+    led: QtWidgets.QLabel
+    led_color: str = "red"
+    connected: bool = False
+
+
 class ConnectionWidget(QtWidgets.QWidget):
     
     # --- Signals ---
     connect_requested = QtCore.Signal(str, str)  # name, address
     disconnect_requested = QtCore.Signal(str)    # name
 
+    # --- Status LED gradients (center, mid, edge) ---
+    _LED_GRADIENTS = {
+        "red": ("#ffcccc", "#ff3333", "#880000"),
+        "green": ("#ccffcc", "#33cc33", "#006600"),
+    }
+    _LED_SIZE = 10
+    _LED_PIXMAPS: dict[str, QtGui.QPixmap] = {}  # rendered once per process
+
     def __init__(self, instrument_names: list[str]) -> None:
         super().__init__()
 
         self._names = list(instrument_names)
         
-        self._edits: dict[str, QtWidgets.QLineEdit] = {}
-        self._buttons: dict[str, QtWidgets.QPushButton] = {}
-        self._status_leds: dict[str, QtWidgets.QLabel] = {}
-        self._connected: dict[str, bool] = {
-            name: False for name in self._names
-        }
+        self._rows: dict[str, _Row] = {}
 
         self._setup_widgets()
         
     # --- Internal Helpers ------------------------------------------------        
 
     def _setup_widgets(self) -> None:
+        # Build all rows before the first layout/paint pass
+        self.setUpdatesEnabled(False)
         layout = QtWidgets.QFormLayout()
+        layout.setEnabled(False)
 
         for name in self._names:            
             led = self._make_status_led()
@@ -36,13 +53,10 @@ class ConnectionWidget(QtWidgets.QWidget):
             edit = QtWidgets.QLineEdit()
 
             button = QtWidgets.QPushButton("Connect")
-            button.clicked.connect(
-                lambda _, n=name: self._on_button_clicked(n)
-            )
+            button.setProperty("instrument_name", name)
+            button.clicked.connect(self._on_instrument_clicked)
 
-            self._status_leds[name] = led
-            self._edits[name] = edit
-            self._buttons[name] = button
+            self._rows[name] = _Row(edit=edit, button=button, led=led)
 
             inner_layout = QtWidgets.QHBoxLayout()
             inner_layout.addWidget(edit)
@@ -57,65 +71,83 @@ class ConnectionWidget(QtWidgets.QWidget):
         layout.addRow("", self._connect_all)
         self.setLayout(layout)
 
-    def _normalize_input(self, name: str) -> None:
-        edit = self._edits[name]
-        edit.setText(edit.text().strip())
+        layout.setEnabled(True)
+        self.setUpdatesEnabled(True)
+
+    def _normalize_input(self, row: _Row) -> None:
+        row.edit.setText(row.edit.text().strip())
 
-    def _set_pending(self, name: str, pending: bool):
-        self._buttons[name].setEnabled(not pending)
+    def _set_pending(self, row: _Row, pending: bool):
+        row.button.setEnabled(not pending)
 
     def _check_name(self, name: str) -> bool:
-        if name not in self._names:
-            log.warning(f"Unknown instrument name: {name}")
+        if name not in self._rows:
+            log.warning("Unknown instrument name: %s", name)
             return False
         
         return True
     
     def _make_status_led(self) -> QtWidgets.QLabel:
         led = QtWidgets.QLabel()
-        led.setFixedSize(10, 10)
+        led.setFixedSize(self._LED_SIZE, self._LED_SIZE)
         self._set_led_color(led, "red")
         return led
+
+    @classmethod
+    def _led_pixmap(cls, color: str) -> QtGui.QPixmap:
+        """
+        Render (once) and return the LED pixmap for a color.
+
+        Pixmaps need a QApplication, so they are built on first use
+        rather than at import time.
+        """
+        pixmap = cls._LED_PIXMAPS.get(color)
+        if pixmap is not None:
+            return pixmap
+
+        size = cls._LED_SIZE
+        center, mid, edge = cls._LED_GRADIENTS[color]
+
+        gradient = QtGui.QRadialGradient(
+            0.3 * size, 0.3 * size, 0.8 * size,  # center, radius
+            0.3 * size, 0.3 * size,              # focal point
+        )
+        gradient.setColorAt(0.0, QtGui.QColor(center))
+        gradient.setColorAt(0.4, QtGui.QColor(mid))
+        gradient.setColorAt(1.0, QtGui.QColor(edge))
+
+        pixmap = QtGui.QPixmap(size, size)
+        pixmap.fill(QtCore.Qt.transparent)
+
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(gradient)
+        painter.drawEllipse(0, 0, size, size)
+        painter.end()
+
+        cls._LED_PIXMAPS[color] = pixmap
+        return pixmap
     
     def _set_led_color(self, led: QtWidgets.QLabel, color: str) -> None:
-        gradients = {
-            "red": """
-                background-color: qradialgradient(
-                    cx:0.3, cy:0.3, radius:0.8,
-                    fx:0.3, fy:0.3,
-                    stop:0 #ffcccc,
-                    stop:0.4 #ff3333,
-                    stop:1 #880000
-                );
-            """,
-            "green": """
-                background-color: qradialgradient(
-                    cx:0.3, cy:0.3, radius:0.8,
-                    fx:0.3, fy:0.3,
-                    stop:0 #ccffcc,
-                    stop:0.4 #33cc33,
-                    stop:1 #006600
-                );
-            """,
-        }
-
-        led.setStyleSheet(f"""
-            border-radius: 5px;
-            {gradients[color]}
-        """)
-
-    def _update_status_led(self, name: str) -> None:
-        color = "green" if self._connected[name] else "red"
-        self._set_led_color(self._status_leds[name], color)
+        led.setPixmap(self._led_pixmap(color))
+
+    def _update_status_led(self, row: _Row) -> None:
+        color = "green" if row.connected else "red"
+        if row.led_color == color:
+            return  # already showing this pixmap
+
+        row.led_color = color
+        self._set_led_color(row.led, color)
 
     # --- Public API ------------------------------------------------------
 
     def apply_presets(self, presets: dict[str, Any]) -> None:
         for name, preset in presets.items():
-            if name not in self._edits:
+            if name not in self._rows:
                 continue
 
-            edit = self._edits[name]
+            edit = self._rows[name].edit
 
             if preset["address"] and not edit.text():
                 edit.setText(preset["address"])
@@ -135,14 +167,20 @@ class ConnectionWidget(QtWidgets.QWidget):
     # UI -> Controller intent
     # ------------------------------------------------------------------
 
+    @QtCore.Slot()
+    def _on_instrument_clicked(self) -> None:
+        self._on_button_clicked(self.sender().property("instrument_name"))
+
     def _on_button_clicked(self, name:str) -> None:        
         if not self._check_name(name):
             return
         
-        if not self._connected[name]:
-            self._set_pending(name, True)
-            self._normalize_input(name)
-            address = self._edits[name].text()
+        row = self._rows[name]
+
+        if not row.connected:
+            self._set_pending(row, True)
+            self._normalize_input(row)
+            address = row.edit.text()
             log.info("Connect requested: %s @ %s", name, address)
             self.connect_requested.emit(name, address)
 
@@ -150,13 +188,14 @@ class ConnectionWidget(QtWidgets.QWidget):
             log.info("Disconnect requested: %s", name)
             self.disconnect_requested.emit(name)
 
+    @QtCore.Slot()
     def _on_connect_all(self) -> None:
         log.info("Connect all requested")
-        for name in self._names:
-            if self._connected[name]:
+        for name, row in self._rows.items():
+            if row.connected:
                 continue
 
-            if not self._buttons[name].isEnabled():
+            if not row.button.isEnabled():
                 continue
 
             self._on_button_clicked(name)
@@ -171,16 +210,15 @@ class ConnectionWidget(QtWidgets.QWidget):
         if not self._check_name(name):
             return
 
-        self._set_pending(name, False)
-        self._connected[name] = connected
+        row = self._rows[name]
 
-        button = self._buttons[name]
-        edit = self._edits[name]
+        self._set_pending(row, False)
+        row.connected = connected
 
-        button.setText("Disconnect" if connected else "Connect")
-        edit.setEnabled(not connected)
+        row.button.setText("Disconnect" if connected else "Connect")
+        row.edit.setEnabled(not connected)
 
-        self._update_status_led(name)
+        self._update_status_led(row)
 
         log.info(
             "Connection state updated: %s -> %s",
@@ -189,17 +227,13 @@ class ConnectionWidget(QtWidgets.QWidget):
         )
 
     def set_enabled(self, enabled: bool) -> None:
-        for name in self._names:
-            button = self._buttons[name]
-            edit = self._edits[name]
-
+        for row in self._rows.values():
             if not enabled:
-                button.setEnabled(False)
-                edit.setEnabled(False)
+                row.button.setEnabled(False)
+                row.edit.setEnabled(False)
             else:
-                connected = self._connected[name]
-                button.setEnabled(True)
-                edit.setEnabled(not connected)
+                row.button.setEnabled(True)
+                row.edit.setEnabled(not row.connected)
 
         if not enabled:
             self._connect_all.setEnabled(False)
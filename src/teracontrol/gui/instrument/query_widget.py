@@ -1,4 +1,4 @@
-from PySide6 import QtWidgets, QtCore
+from PySide6 import QtWidgets, QtCore, QtGui
 from teracontrol.utils.logging import get_logger
 
 log = get_logger(__name__)
@@ -9,6 +9,8 @@ class QueryWidget(QtWidgets.QWidget):
     # --- Signals ---
     query_requested = QtCore.Signal(str, str)  # name, message
 
+    MAX_RESPONSE_LINES = 2000  # oldest lines are dropped beyond this
+
     def __init__(self, instrument_names: list[str]):
         super().__init__()
 
@@ -30,18 +32,20 @@ class QueryWidget(QtWidgets.QWidget):
         layout = QtWidgets.QFormLayout()
 
         self._response.setReadOnly(True)
-        self._response.font().setFamily("Monospace")
+        self._response.setMaximumBlockCount(self.MAX_RESPONSE_LINES)
+        self._response.setUndoRedoEnabled(False)
+        self._response.setFont(
+            QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
+        )
 
         for name in self._names:
             query = QtWidgets.QLineEdit()
-            query.returnPressed.connect(
-                lambda n=name: self._on_return_pressed(n)
-            )
+            query.setProperty("instrument_name", name)
+            query.returnPressed.connect(self._on_request)
 
             button = QtWidgets.QPushButton("Query")
-            button.clicked.connect(
-                lambda _, n=name: self._on_button_clicked(n)
-            )
+            button.setProperty("instrument_name", name)
+            button.clicked.connect(self._on_request)
 
             self._queries[name] = query
             self._buttons[name] = button
@@ -59,17 +63,22 @@ class QueryWidget(QtWidgets.QWidget):
     
     # --- UI -> Controller intent -----------------------------------------
 
-    def _on_button_clicked(self, name:str):
+    @QtCore.Slot()
+    def _on_request(self) -> None:
+        # Button click and Return in the line edit share this handler
+        name = self.sender().property("instrument_name")
         if self._waiting[name]:
-            return # Ignore clicks while waiting
+            return # Ignore requests while waiting
         
-        self._waiting[name] = True
+        self._set_waiting(name, True)
         cmd = self._queries[name].text()
         log.info("Query requested: %s -> %s", name, cmd)
         self.query_requested.emit(name, cmd)
 
-    def _on_return_pressed(self, name: str):
-        self._on_button_clicked(name)
+    def _set_waiting(self, name: str, waiting: bool) -> None:
+        self._waiting[name] = waiting
+        self._queries[name].setReadOnly(waiting)
+        self._buttons[name].setEnabled(not waiting)
 
     # --- Controller -> UI state updates ---------------------------------
 
@@ -77,7 +86,7 @@ class QueryWidget(QtWidgets.QWidget):
         self._response.appendPlainText(
             f"{name}:\n    Query: {query}\n    Response: {response}\n"
         )
-        self._waiting[name] = False
+        self._set_waiting(name, False)
         log.info("Query response: %s -> %s -> %s", name, query, response)
 
     def set_enabled(self, enabled: bool, name: str | None = None) -> None:
@@ -87,5 +96,7 @@ class QueryWidget(QtWidgets.QWidget):
             names = [name]
 
         for name in names:
+            # A (re)connect or disconnect ends any pending request
+            self._set_waiting(name, False)
             self._buttons[name].setEnabled(enabled)
             self._queries[name].setEnabled(enabled)
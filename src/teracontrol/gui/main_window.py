@@ -1,5 +1,5 @@
 from typing import Any
-from PySide6 import QtWidgets
+from PySide6 import QtWidgets, QtCore
 
 from teracontrol.app.controller import AppController
 from teracontrol.core.experiment import ExperimentStatus
@@ -19,6 +19,7 @@ log = get_logger(__name__)
 class MainWindow(QtWidgets.QMainWindow):
     APP_NAME = "TeraControl 0.1.0-dev"
     WIN_SIZE = (1200, 800)
+    PROGRESS_INTERVAL_MS = 33  # caps step-progress repaints at ~30 Hz
 
     def __init__(self, controller: AppController) -> None:
         super().__init__()
@@ -27,6 +28,15 @@ class MainWindow(QtWidgets.QMainWindow):
         self._instrument_names = controller.instrument_names()
         self._axis_catalog = controller.axis_catalog()
         self._presets = controller.presets()
+        self._connected: set[str] = set()  # replayed into a late QueryWidget
+        self._last_idle: bool | None = None
+
+        # Latest step progress, applied on the next timer tick
+        self._pending_step_progress: tuple[int, int, str] | None = None
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(self.PROGRESS_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._apply_step_progress)
 
         self._setup_window()
         self._setup_menus()
@@ -52,10 +62,16 @@ class MainWindow(QtWidgets.QMainWindow):
     def _setup_widgets(self) -> None:
         self.widgets = {
             "connection": ConnectionWidget(self._instrument_names),
-            "query": QueryWidget(self._instrument_names),
+            "query": None,  # built on first show (hidden debug dock)
             "experiment": ExperimentControlWidget(self._axis_catalog),
             "monitor": MonitorWidget(),
         }
+
+        # Direct references for the slots (skip the dict lookups)
+        self._connection = self.widgets["connection"]
+        self._query: QueryWidget | None = None
+        self._experiment = self.widgets["experiment"]
+        self._monitor = self.widgets["monitor"]
     
     def _load_presets(self) -> None:
         if "instruments" in self._presets:
@@ -80,7 +96,7 @@ class MainWindow(QtWidgets.QMainWindow):
             "query": DockWidget(
                 name="Query",
                 parent=self,
-                widget=self.widgets["query"],
+                widget=None,
                 menu=self.menus["debug"],
                 set_floating=True,
             ),
@@ -114,8 +130,8 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         
         # --- Query ---
-        self.widgets["query"].query_requested.connect(
-            self._on_query
+        self.docks["query"].visibilityChanged.connect(
+            self._on_query_dock_visibility
         )
 
         # --- Experiment ---
@@ -135,47 +151,96 @@ class MainWindow(QtWidgets.QMainWindow):
             self._on_axis_selected
         )
 
+    def _create_query_widget(self) -> None:
+        widget = QueryWidget(self._instrument_names)
+        for name in self._connected:
+            widget.set_enabled(True, name)
+        widget.query_requested.connect(self._on_query)
+
+        self.widgets["query"] = self._query = widget
+        self.docks["query"].setWidget(widget)
+
     # ------------------------------------------------------------------
     # Slots
     # ------------------------------------------------------------------
 
+    @QtCore.Slot(ExperimentStatus)
     def _on_experiment_status_changed(self, status: ExperimentStatus) -> None:
-        self.widgets["experiment"].set_state(status)
-        self.widgets["connection"].set_enabled(
-            status == ExperimentStatus.IDLE
-        )
+        self._experiment.set_state(status)
 
+        # RUNNING <-> PAUSED leaves the connection panel as it is
+        idle = status == ExperimentStatus.IDLE
+        if idle != self._last_idle:
+            self._last_idle = idle
+            self._connection.set_enabled(idle)
+
+    @QtCore.Slot(str, str)
     def _on_connect(self, name: str, address: str) -> None:
         ok = self._controller.connect(name, address)
-        self.widgets["connection"].set_connected(name, ok)
-        self.widgets["query"].set_enabled(ok, name)
-
+        self._connection.set_connected(name, ok)
+        if ok:
+            self._connected.add(name)
+        else:
+            self._connected.discard(name)
+        if self._query is not None:
+            self._query.set_enabled(ok, name)
+
+    @QtCore.Slot(str)
     def _on_disconnect(self, name: str) -> None:
         self._controller.disconnect(name)
-        self.widgets["connection"].set_connected(name, False)
-        self.widgets["query"].set_enabled(False, name)
+        self._connection.set_connected(name, False)
+        self._connected.discard(name)
+        if self._query is not None:
+            self._query.set_enabled(False, name)
 
-    def _on_query(self, name: str, cmd: str) -> None:
-        response = self._controller.query(name, cmd)
-        self.widgets["query"].update_response(name, cmd, response)
+    @QtCore.Slot(bool)
+    def _on_query_dock_visibility(self, visible: bool) -> None:
+        if visible and self._query is None:
+            self._create_query_widget()
 
+    @QtCore.Slot(str, str)
+    def _on_query(self, name: str, cmd: str) -> None:
+        response = "<query failed, see log>"
+        try:
+            response = self._controller.query(name, cmd)
+        finally:
+            # Release the row's wait state even if the query raised
+            self._query.update_response(name, cmd, response)
+
+    @QtCore.Slot(DataAtom, dict)
     def _on_new_data(self, data: DataAtom, meta: dict[str, Any]) -> None:
-        self.widgets["monitor"].on_new_waveform(data.payload, meta)
+        self._monitor.on_new_waveform(data.payload, meta)
 
+    @QtCore.Slot(int)
     def _on_sweep_created(self, npoints: int) -> None:
-        self.widgets["monitor"].clear()
-        self.widgets["monitor"].configure(npoints)
+        self._monitor.clear()
+        self._monitor.configure(npoints)
 
+    @QtCore.Slot(int, int)
     def _on_step_finished(self, index: int, total: int) -> None:
-        self.widgets["experiment"].set_progress(index, total)
+        self._experiment.set_progress(index, total)
 
+    @QtCore.Slot(str)
     def _on_axis_selected(self, axis_name: str) -> None:
-        self.widgets["experiment"].load_presets(
+        self._experiment.load_presets(
             self._controller.presets()["axes"][axis_name]
         )
 
+    @QtCore.Slot(int, int, str)
     def _on_step_progress(self, current: int, total: int, message: str) -> None:
-        self.widgets["experiment"].set_step_progress(current, total, message)
+        # Keep only the newest value; bursts collapse into one repaint
+        self._pending_step_progress = (current, total, message)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    @QtCore.Slot()
+    def _apply_step_progress(self) -> None:
+        progress, self._pending_step_progress = (
+            self._pending_step_progress, None
+        )
+        if progress is not None:
+            self._experiment.set_step_progress(*progress)
 
+    @QtCore.Slot(int, int)
     def _on_run_progress(self, current: int, total: int) -> None:
-        self.widgets["experiment"].set_progress(current, total)
\ No newline at end of file
+        self._experiment.set_progress(current, total)
\ No newline at end of file
@@ -9,13 +9,14 @@ class DockWidget(QtWidgets.QDockWidget):
         self,
         name: str,
         parent: QtWidgets.QMainWindow,
-        widget: QtWidgets.QWidget,
+        widget: QtWidgets.QWidget | None,
         menu: QtWidgets.QMenu | None = None,
         set_floating: bool = False,
     ) -> None:
         super().__init__(name, parent)
         
-        self.setWidget(widget)
+        if widget is not None:  # None: content is set later by the owner
+            self.setWidget(widget)
         if set_floating:
             self.setFloating(True)
             self.resize(parent.WIN_SIZE[0]/2, parent.WIN_SIZE[1]/2)
@@ -1,5 +1,7 @@
 from PySide6 import QtWidgets, QtCore, QtGui
 
+from .plot_config import HUE_BUCKETS, hue_bucket
+
 
 class CurveListWidget(QtWidgets.QWidget):
     """
@@ -8,11 +10,21 @@ class CurveListWidget(QtWidgets.QWidget):
     """
 
     visibility_changed = QtCore.Signal(int, bool)
+    visibility_bulk_changed = QtCore.Signal(list)  # one bool per curve
+
+    # --- Color swatches, shared per hue bucket ---
+    _SWATCH_SIZE = 8
+    _SWATCH_PIXMAPS: dict[int, QtGui.QPixmap] = {}  # rendered once per process
 
     def __init__(self):
         super().__init__()
 
         self._list = QtWidgets.QListWidget()
+        # One-line rows of equal height: skip per-item size measuring and
+        # lay out long lists in batches
+        self._list.setUniformItemSizes(True)
+        self._list.setLayoutMode(QtWidgets.QListView.Batched)
+        self._list.setBatchSize(64)
         self._list.itemChanged.connect(self._on_item_changed)
 
         self._show_all = QtWidgets.QPushButton("Show All")
@@ -42,10 +54,7 @@ class CurveListWidget(QtWidgets.QWidget):
         item.setFlags(item.flags() | QtCore.Qt.ItemIsUserCheckable)
         item.setCheckState(QtCore.Qt.Checked)
 
-        color = QtGui.QColor.fromHsvF(hue, 1.0, 1.0)
-        pix = QtGui.QPixmap(8, 8)
-        pix.fill(color)
-        item.setData(QtCore.Qt.DecorationRole, pix)
+        item.setData(QtCore.Qt.DecorationRole, self._swatch_pixmap(hue))
 
         self._list.addItem(item)
 
@@ -56,18 +65,46 @@ class CurveListWidget(QtWidgets.QWidget):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @QtCore.Slot(QtWidgets.QListWidgetItem)
     def _on_item_changed(self, item: QtWidgets.QListWidgetItem) -> None:
         index = self._list.row(item)
         visible = item.checkState() == QtCore.Qt.Checked
         self.visibility_changed.emit(index, visible)
 
+    @QtCore.Slot()
     def _on_show_all(self) -> None:
-        for i in range(self._list.count()):
-            self._list.item(i).setCheckState(QtCore.Qt.Checked)
+        self._set_all_checked(True)
 
+    @QtCore.Slot()
     def _on_hide_all(self) -> None:
-        for i in range(self._list.count()):
-            self._list.item(i).setCheckState(QtCore.Qt.Unchecked)
+        self._set_all_checked(False)
+
+    def _set_all_checked(self, checked: bool) -> None:
+        # One bulk signal instead of an itemChanged per item
+        state = QtCore.Qt.Checked if checked else QtCore.Qt.Unchecked
+        count = self._list.count()
+        with QtCore.QSignalBlocker(self._list):
+            for i in range(count):
+                self._list.item(i).setCheckState(state)
+        self.visibility_bulk_changed.emit([checked] * count)
+
+    @classmethod
+    def _swatch_pixmap(cls, hue: float) -> QtGui.QPixmap:
+        """
+        Return the (implicitly shared) swatch pixmap for a hue bucket.
+        """
+        bucket = hue_bucket(hue)
+        pixmap = cls._SWATCH_PIXMAPS.get(bucket)
+        if pixmap is not None:
+            return pixmap
+
+        pixmap = QtGui.QPixmap(cls._SWATCH_SIZE, cls._SWATCH_SIZE)
+        pixmap.fill(
+            QtGui.QColor.fromHsvF(bucket / HUE_BUCKETS, 1.0, 1.0)
+        )
+
+        cls._SWATCH_PIXMAPS[bucket] = pixmap
+        return pixmap
 
     @staticmethod
     def _make_label(index: int, meta: dict) -> str:
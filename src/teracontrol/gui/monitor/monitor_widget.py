@@ -1,16 +1,21 @@
 from PySide6 import QtWidgets, QtCore
+from collections import OrderedDict
 from dataclasses import dataclass
 
 from .signal_widget import SignalWidget
 from .trends_widget import TrendsWidget
 from .curve_list_widget import CurveListWidget
-from teracontrol.core.data.data import Waveform, WaveSpectrum, waveform_to_wavespectrum
+from teracontrol.core.data.data import (
+    Waveform,
+    WaveSpectrum,
+    waveforms_to_wavespectra,
+)
 from teracontrol.utils.logging import get_logger
 
 log = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CurveEntry:
     waveform: Waveform
     spectrum: WaveSpectrum
@@ -22,18 +27,33 @@ class CurveEntry:
 class MonitorWidget(QtWidgets.QWidget):
     """Tabbed monitor: Signal + Trends + Curves"""
 
+    FLUSH_INTERVAL_MS = 16  # incoming waveforms are added in batches
+
     def __init__(self):
         super().__init__()
 
         # --- GUI cache / registry ---
         self._curves: list[CurveEntry] = []
         self._expected_load_size: int = 0
+        self._hue_lut: tuple[float, ...] = ()
         self._fft_tmax: float | None = None
         self._fft_pad: int | None = None
 
+        # Spectra per (waveform id, t_cut, pad), LRU-bounded to two settings
+        self._spectra: OrderedDict[
+            tuple[int, float | None, int | None], WaveSpectrum
+        ] = OrderedDict()
+
+        # --- Incoming waveform coalescing ---
+        self._pending: list[tuple[Waveform, dict | None]] = []
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
         # --- Child widgets ---
         self.signal_widget = SignalWidget()
-        self.trends_widget = TrendsWidget()
+        self.trends_widget: TrendsWidget | None = None  # built on first view
         self.curve_list_widget = CurveListWidget()
         #self.settings_widget = QtWidgets.QWidget()  # TODO: implement
 
@@ -41,6 +61,9 @@ class MonitorWidget(QtWidgets.QWidget):
         self.curve_list_widget.visibility_changed.connect(
             self.set_curve_visible
         )
+        self.curve_list_widget.visibility_bulk_changed.connect(
+            self.set_all_visible
+        )
         self.signal_widget.cursor_moved_signal.connect(
             self.set_fft_tmax
         )
@@ -51,7 +74,9 @@ class MonitorWidget(QtWidgets.QWidget):
         # --- GUI layout ---
         self.tabs1 = QtWidgets.QTabWidget()
         self.tabs1.addTab(self.signal_widget, "Signal")
-        self.tabs1.addTab(self.trends_widget, "Trends")
+        self._trends_placeholder = QtWidgets.QWidget()
+        self.tabs1.addTab(self._trends_placeholder, "Trends")
+        self.tabs1.currentChanged.connect(self._on_tab_changed)
 
         self.tabs2 = QtWidgets.QTabWidget()
         self.tabs2.addTab(self.curve_list_widget, "Curves")
@@ -77,76 +102,160 @@ class MonitorWidget(QtWidgets.QWidget):
     def configure(self, expected_load_size: int) -> None:
         self._expected_load_size = expected_load_size
 
-    def on_new_waveform(self, wf: Waveform, meta: dict | None = None) -> None:
-        """Append a new waveform to the monitor"""
-        sp = waveform_to_wavespectrum(wf, t_cut=self._fft_tmax, length=self._fft_pad)
-        hue = self._get_hue(len(self._curves))
-
-        curve = CurveEntry(waveform=wf, spectrum=sp, visible=True, meta=meta, hue=hue)
-
-        self._curves.append(curve)
-
-        self.curve_list_widget.append_curve(meta, hue)
-        self.signal_widget.append_curve(curve)
-        self.trends_widget.append_curve(curve)
+        # Hues of a sweep are a fixed progression; .84 prevents ending in
+        # red back again
+        span = max(expected_load_size - 1, 1)
+        if expected_load_size > 1:
+            self._hue_lut = tuple(
+                (i / span) * .84 for i in range(expected_load_size)
+            )
+        else:
+            self._hue_lut = (0.0,) * expected_load_size
 
-        self._refresh_views()
+    def on_new_waveform(self, wf: Waveform, meta: dict | None = None) -> None:
+        """Queue a new waveform; queued waveforms are added in one batch"""
+        self._pending.append((wf, meta))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
+    @QtCore.Slot(int, bool)
     def set_curve_visible(self, index: int, visible: bool) -> None:
         """Toggle the visibility of a curve"""
         if 0 <= index < len(self._curves):
             self._curves[index].visible = visible
-            self._refresh_views()
+            self.signal_widget.set_visibility(index, visible)
+            if self.trends_widget is not None:
+                self.trends_widget.set_visibility(index, visible)
 
+    @QtCore.Slot(list)
+    def set_all_visible(self, visible: list[bool]) -> None:
+        """Set the visibility of every curve at once"""
+        for curve, v in zip(self._curves, visible):
+            curve.visible = v
+        self._refresh_views()
+
+    @QtCore.Slot(float)
     def set_fft_tmax(self, t: float) -> None:
         self._fft_tmax = t
-        log.info(f"FFT truncation set to {t:.3f}")
+        log.info("FFT truncation set to %.3f", t)
         self._recompute_ffts()
         self.signal_widget.refresh_spectra(self._curves)
         self.signal_widget.update_cursor_visor(t)
 
+    @QtCore.Slot(int)
     def set_pad(self, power: int) -> None:
         if power <= 0:
             self._fft_pad = None
             log.info("FFT padding disabled")
         else:
             self._fft_pad = 2**power
-            log.info(f"FFT padding set to 2^{power}")
+            log.info("FFT padding set to 2^%d", power)
         self._recompute_ffts()
         self.signal_widget.refresh_spectra(self._curves)
 
     def clear(self) -> None:
+        self._flush_timer.stop()
+        self._pending.clear()
         self._curves.clear()
+        self._spectra.clear()
         self.signal_widget.clear()
-        self.trends_widget.clear()
+        if self.trends_widget is not None:
+            self.trends_widget.clear()
         self.curve_list_widget.clear()
         self._fft_tmax = None  # reset (conform to cursor behavior)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+
+    @QtCore.Slot()
+    def _flush_pending(self) -> None:
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        spectra = self._spectra_for([wf for wf, _ in pending])
+        self.curve_list_widget.setUpdatesEnabled(False)  # one repaint
+        try:
+            with self.signal_widget.bulk_append():  # one auto-range
+                for (wf, meta), sp in zip(pending, spectra):
+                    hue = self._get_hue(len(self._curves))
+
+                    curve = CurveEntry(
+                        waveform=wf, spectrum=sp, visible=True, meta=meta,
+                        hue=hue,
+                    )
+                    self._curves.append(curve)
+
+                    self.curve_list_widget.append_curve(meta, hue)
+                    self.signal_widget.append_curve(curve)
+                    if self.trends_widget is not None:
+                        self.trends_widget.append_curve(curve)
+        finally:
+            self.curve_list_widget.setUpdatesEnabled(True)
+
+        self._trim_spectra()
+        self._refresh_views()  # once per batch
     
     def _refresh_views(self) -> None:
         visible = [c.visible for c in self._curves]
         self.signal_widget.toggle_visibility(visible)
-        self.trends_widget.toggle_visibility(visible)
+        if self.trends_widget is not None:
+            self.trends_widget.toggle_visibility(visible)
+
+    @QtCore.Slot(int)
+    def _on_tab_changed(self, index: int) -> None:
+        if self.tabs1.widget(index) is self._trends_placeholder:
+            self._create_trends_widget(index)
+
+    def _create_trends_widget(self, index: int) -> None:
+        widget = TrendsWidget()
+        for curve in self._curves:  # replay what arrived before
+            widget.append_curve(curve)
+        widget.toggle_visibility([c.visible for c in self._curves])
+
+        with QtCore.QSignalBlocker(self.tabs1):
+            self.tabs1.removeTab(index)
+            self.tabs1.insertTab(index, widget, "Trends")
+            self.tabs1.setCurrentIndex(index)
+
+        self._trends_placeholder.deleteLater()
+        self._trends_placeholder = None
+        self.trends_widget = widget
 
     def _get_hue(self, index: int) -> float:
-        total = self._expected_load_size
-        
-        if index >= total:
-            return 0.0
-        
-        if total <= 1:
-            return 0.0
-        
-        # .84 prevents ending in red back again
-        return ( index / max(total - 1, 1) ) * .84
+        if index < len(self._hue_lut):
+            return self._hue_lut[index]
+        return 0.0
     
-    def _recompute_ffts(self) -> None:
-        for curve in self._curves:
-            curve.spectrum = waveform_to_wavespectrum(
-                curve.waveform,
+    def _spectra_for(self, waveforms: list[Waveform]) -> list[WaveSpectrum]:
+        # Curves keep their waveforms alive until clear(), so ids are stable
+        keys = [(id(wf), self._fft_tmax, self._fft_pad) for wf in waveforms]
+        spectra = [self._spectra.get(key) for key in keys]
+
+        # Cache misses go through one batched FFT
+        missing = [i for i, sp in enumerate(spectra) if sp is None]
+        if missing:
+            computed = waveforms_to_wavespectra(
+                [waveforms[i] for i in missing],
                 t_cut=self._fft_tmax,
                 length=self._fft_pad,
-            )
\ No newline at end of file
+            )
+            for i, sp in zip(missing, computed):
+                spectra[i] = sp
+
+        for key, sp in zip(keys, spectra):
+            self._spectra[key] = sp
+            self._spectra.move_to_end(key)
+        return spectra
+
+    def _trim_spectra(self) -> None:
+        limit = 2 * len(self._curves)
+        while len(self._spectra) > limit:
+            self._spectra.popitem(last=False)
+
+    def _recompute_ffts(self) -> None:
+        spectra = self._spectra_for([c.waveform for c in self._curves])
+        for curve, sp in zip(self._curves, spectra):
+            curve.spectrum = sp
+        self._trim_spectra()
\ No newline at end of file
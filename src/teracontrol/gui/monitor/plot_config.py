@@ -0,0 +1,55 @@
+import os
+from functools import lru_cache
+from importlib.util import find_spec
+import pyqtgraph as pg
+
+from teracontrol.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+OPENGL_ENV = "TERACONTROL_OPENGL"
+
+# Curve pens and curve-list swatches share these buckets so they match
+HUE_BUCKETS = 256
+
+
+@lru_cache(maxsize=1)
+def use_opengl() -> bool:
+    """
+    Whether plots should render through OpenGL.
+
+    Opt-in via TERACONTROL_OPENGL=1; needs PyOpenGL. Otherwise the
+    default raster (QPainter) backend is kept.
+    """
+    requested = os.environ.get(OPENGL_ENV, "").strip().lower()
+    if requested not in {"1", "true", "yes", "on"}:
+        return False
+
+    # Only probe for PyOpenGL; pyqtgraph imports it on useOpenGL()
+    if find_spec("OpenGL") is None:
+        log.warning(
+            "%s is set but PyOpenGL is not installed; using raster plots",
+            OPENGL_ENV,
+        )
+        return False
+
+    return True
+
+
+def hue_bucket(hue: float) -> int:
+    """
+    Index of the hue bucket a curve hue in [0, 1) is drawn with.
+    """
+    return int(hue * HUE_BUCKETS) % HUE_BUCKETS
+
+
+def configure_plot(plot: pg.PlotWidget) -> None:
+    """
+    Apply the shared rendering settings to a monitor plot.
+    """
+    # Draw at most ~one point per pixel; peak mode keeps the extrema
+    plot.setDownsampling(auto=True, mode="peak")
+    plot.setClipToView(True)
+
+    if use_opengl():
+        plot.useOpenGL(True)
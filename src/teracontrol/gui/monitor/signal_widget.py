@@ -1,5 +1,8 @@
+from contextlib import contextmanager
 import pyqtgraph as pg
-from PySide6 import QtWidgets, QtCore
+from PySide6 import QtWidgets, QtCore, QtGui
+
+from .plot_config import HUE_BUCKETS, configure_plot, hue_bucket
 
 
 class SignalWidget(QtWidgets.QWidget):
@@ -8,11 +11,15 @@ class SignalWidget(QtWidgets.QWidget):
     cursor_moved_signal = QtCore.Signal(float)
     pad_changed_signal = QtCore.Signal(int)
 
+    # --- Curve pens, shared per hue bucket ---
+    _PENS: dict[int, QtGui.QPen] = {}  # built once per process
+
     def __init__(self):
         super().__init__()
 
         self.time_curves: dict[int, pg.PlotCurveItem] = {}
         self.freq_curves: dict[int, pg.PlotCurveItem] = {}
+        self._shown_spectra: dict[int, object] = {}  # spectrum on screen
 
         self._setup_plots()
         self._setup_controls()
@@ -38,6 +45,9 @@ class SignalWidget(QtWidgets.QWidget):
         self.freqplot.setLabel("bottom", "Frequency", units="THz")
         self.freqplot.setLabel("left", "Amplitude", units="arb. units")
 
+        for plot in (self.timeplot, self.freqplot):
+            configure_plot(plot)
+
     def _setup_controls(self) -> None:
         self.controls = QtWidgets.QWidget()
         self.cursor = None
@@ -71,7 +81,7 @@ class SignalWidget(QtWidgets.QWidget):
 
     def append_curve(self, curve) -> None:        
         new_idx = len(self.time_curves)
-        pen = pg.mkPen(pg.hsvColor(curve.hue, 1.0, 1.0), width=2)
+        pen = self._curve_pen(curve.hue)
 
         self.time_curves[new_idx] = self.timeplot.plot(
             curve.waveform.time, curve.waveform.signal, pen=pen
@@ -80,6 +90,7 @@ class SignalWidget(QtWidgets.QWidget):
         self.freq_curves[new_idx] = self.freqplot.plot(
             curve.spectrum.freq, curve.spectrum.amp, pen=pen
         )
+        self._shown_spectra[new_idx] = curve.spectrum
 
         if self.cursor is None:
             self.cursor = pg.InfiniteLine(
@@ -93,16 +104,40 @@ class SignalWidget(QtWidgets.QWidget):
                 self._on_cursor_moved
             )
 
+    @contextmanager
+    def bulk_append(self):
+        """
+        Suspend auto-range while several curves are appended.
+
+        Each view re-ranges once on exit, and only on the axes that were
+        auto-ranging before (a user zoom is left alone).
+        """
+        views = [plot.getViewBox() for plot in (self.timeplot, self.freqplot)]
+        states = [view.autoRangeEnabled() for view in views]
+        for view in views:
+            view.disableAutoRange()
+        try:
+            yield
+        finally:
+            for view, (x, y) in zip(views, states):
+                view.enableAutoRange(x=x, y=y)
+
     def toggle_visibility(self, visible: list[bool]) -> None:
         for idx, v in enumerate(visible):
             self.time_curves[idx].setVisible(v)
             self.freq_curves[idx].setVisible(v)
 
+    def set_visibility(self, index: int, visible: bool) -> None:
+        self.time_curves[index].setVisible(visible)
+        self.freq_curves[index].setVisible(visible)
+
     def refresh_spectra(self, curves: list[object]) -> None:
         for idx, curve in enumerate(curves):
-            self.freq_curves[idx].setData(
-                curve.spectrum.freq, curve.spectrum.amp
-            )
+            spectrum = curve.spectrum
+            if self._shown_spectra.get(idx) is spectrum:
+                continue  # unchanged (cached) spectrum: keep the path
+            self._shown_spectra[idx] = spectrum
+            self.freq_curves[idx].setData(spectrum.freq, spectrum.amp)
 
     def update_cursor_visor(self, t: float) -> None:
         self.cursor_visor.setText(f"{t:.1f}")
@@ -112,6 +147,7 @@ class SignalWidget(QtWidgets.QWidget):
         self.freqplot.clear()
         self.time_curves.clear()
         self.freq_curves.clear()
+        self._shown_spectra.clear()
         self.cursor = None
         self.cursor_visor.setText("")
 
@@ -119,9 +155,20 @@ class SignalWidget(QtWidgets.QWidget):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @classmethod
+    def _curve_pen(cls, hue: float) -> QtGui.QPen:
+        bucket = hue_bucket(hue)
+        pen = cls._PENS.get(bucket)
+        if pen is None:
+            color = pg.hsvColor(bucket / HUE_BUCKETS, 1.0, 1.0)
+            pen = cls._PENS[bucket] = pg.mkPen(color, width=2)
+        return pen
+
+    @QtCore.Slot(object)
     def _on_cursor_moved(self, line: pg.InfiniteLine) -> None:
         pos = float(line.getPos()[0])
         self.cursor_moved_signal.emit(pos)
 
+    @QtCore.Slot()
     def _on_pad_changed(self) -> None:
         self.pad_changed_signal.emit(self.pad_entry.value())
\ No newline at end of file
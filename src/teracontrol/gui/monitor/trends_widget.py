@@ -1,17 +1,33 @@
 import numpy as np
 import pyqtgraph as pg
-from PySide6 import QtWidgets
+from PySide6 import QtWidgets, QtCore
+
+from .plot_config import configure_plot
 
 
 class TrendsWidget(QtWidgets.QWidget):
     """Stacked plots of peak amplitude and peak position"""
 
+    REPLOT_INTERVAL_MS = 33  # caps trend redraws at ~30 FPS
+    INITIAL_CAPACITY = 64    # trend buffers double when full
+
     def __init__(self):
         super().__init__()
 
-        self._x: list[int] = []
-        self._amp: list[float] = []
-        self._pos: list[float] = []
+        # Preallocated trend values; the first _n entries are valid
+        self._n = 0
+        self._amp = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self._pos = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self._visible = np.empty(self.INITIAL_CAPACITY, dtype=bool)
+
+        # --- Replot coalescing ---
+        self._dirty = False
+        self._replot_timer = QtCore.QTimer(self)
+        self._replot_timer.setSingleShot(True)
+        self._replot_timer.setInterval(self.REPLOT_INTERVAL_MS)
+        self._replot_timer.timeout.connect(
+            self._on_replot, QtCore.Qt.QueuedConnection
+        )
 
         # --- Plots ---
         self.amp_plot = pg.PlotWidget(title="Peak amplitude")
@@ -22,6 +38,9 @@ class TrendsWidget(QtWidgets.QWidget):
         self.pos_plot.setLabel("left", "Time", units="ps")
         self.pos_plot.setLabel("bottom", "Index")
 
+        for plot in (self.amp_plot, self.pos_plot):
+            configure_plot(plot)
+
         # --- Curves ---
         self.amp_curve = self.amp_plot.plot()
         self.pos_curve = self.pos_plot.plot()
@@ -41,21 +60,53 @@ class TrendsWidget(QtWidgets.QWidget):
         )
         pos = float(curve.waveform.time[i])
 
-        self._x.append(len(self._x))
-        self._amp.append(amp)
-        self._pos.append(pos)
+        if self._n == len(self._amp):
+            self._amp = np.concatenate((self._amp, np.empty_like(self._amp)))
+            self._pos = np.concatenate((self._pos, np.empty_like(self._pos)))
+            self._visible = np.concatenate(
+                (self._visible, np.empty_like(self._visible))
+            )
+
+        self._amp[self._n] = amp
+        self._pos[self._n] = pos
+        self._visible[self._n] = True
+        self._n += 1
 
     def toggle_visibility(self, visible: list[bool]) -> None:
-        x = [i+1 for i, v in enumerate(visible) if v]
-        amp = [self._amp[i-1] for i in x]
-        pos = [self._pos[i-1] for i in x]
+        """Schedule a redraw; bursts of updates collapse into one."""
+        self._visible[:self._n] = np.asarray(visible, dtype=bool)
+        self._schedule_replot()
+
+    def set_visibility(self, index: int, visible: bool) -> None:
+        """Show or hide a single point; the redraw is scheduled."""
+        self._visible[index] = visible
+        self._schedule_replot()
+
+    def _schedule_replot(self) -> None:
+        self._dirty = True
+        if not self._replot_timer.isActive():
+            self._replot_timer.start()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._dirty:  # changes arrived while the tab was hidden
+            self._schedule_replot()
+
+    @QtCore.Slot()
+    def _on_replot(self) -> None:
+        if not self._dirty or not self.isVisible():
+            return  # stays dirty; showEvent replots
+        self._dirty = False
+
+        idx = np.flatnonzero(self._visible[:self._n])
 
-        self.amp_curve.setData(x, amp)
-        self.pos_curve.setData(x, pos)
+        # Gathered straight from the buffers; x is the 1-based curve index
+        self.amp_curve.setData(idx + 1, self._amp[idx])
+        self.pos_curve.setData(idx + 1, self._pos[idx])
 
     def clear(self) -> None:
-        self._x.clear()
-        self._amp.clear()
-        self._pos.clear()
+        self._replot_timer.stop()
+        self._dirty = False
+        self._n = 0  # buffers are kept for the next run
         self.amp_curve.clear()
         self.pos_curve.clear()
\ No newline at end of file
@@ -1,6 +1,5 @@
 import socket
 import warnings
-import time
 import numpy as np
 from typing import Any, Callable
 
@@ -215,16 +214,19 @@ class TeraflashTHzSystem(BaseHAL):
             sock.close()
             log.debug("TCP socket closed")
 
-    def _recv_exact(self, sock, nbytes: int) -> bytes:
+    def _recv_exact(self, sock, nbytes: int) -> bytearray:
         log.debug("Receiving %d bytes (exact)", nbytes)
 
-        data = b""
-        while len(data) < nbytes:
-            chunk = sock.recv(nbytes - len(data))
-            if not chunk:
+        # Receive straight into one preallocated buffer (no chunk copies)
+        data = bytearray(nbytes)
+        view = memoryview(data)
+        received = 0
+        while received < nbytes:
+            n = sock.recv_into(view[received:])
+            if n == 0:
                 log.error("TCP connection closed prematurely")
                 raise RuntimeError("TCP connection closed prematurely")
-            data += chunk
+            received += n
 
         return data
     
@@ -274,9 +276,9 @@ class TeraflashTHzSystem(BaseHAL):
     # ------------------------------------------------------------------
 
     def query(self, command: str) -> str:
-        log.info(f"Query: {command}")
+        log.info("Query: %s", command)
         response = self._send_command(command)
-        log.info(f"Response: {response}")
+        log.info("Response: %s", response)
         return response
 
     # ------------------------------------------------------------------
@@ -376,59 +378,6 @@ class TeraflashTHzSystem(BaseHAL):
     # High-level methods
     # ------------------------------------------------------------------
 
-    def acquire_averaged_trace(self, timeout_s: float | None = None):
-        log.info("Starting averaged trace acquisition")
-
-        # Estimate timeout if not provided
-        if timeout_s is None:
-            try:
-                tac_time = self.read_tactime_s()
-                timeout_s = max(self.timeout, 2.0 * tac_time + 3.0)
-                log.debug("Estimated timeout: %.2fs", timeout_s)
-
-            except Exception:
-                # Fallback if estimation fails
-                timeout_s = self.timeout
-                log.warning(
-                    "Failed to read TAC.TIME; using default timeout"
-                )
-                warnings.warn(
-                    "Failed to read TAC.TIME; falling back to default timeout",
-                    RuntimeWarning,
-                )
-
-        # Reset averaging and start countdown
-        self.set_auto_on()
-        log.debug("AUTO mode enabled, waiting for WAIT=ON")
-
-        # Wait until firmware signals completion (WAIT ON)
-        t0 = time.monotonic()
-        while True:
-            try:
-                if self.read_wait_state() == "ON":
-                    log.debug("WAIT=ON detected")
-                    break
-
-            except Exception:
-                pass
-
-            if time.monotonic() - t0 > timeout_s:
-                log.error("Timeout waiting for WAIT=ON")
-                raise TimeoutError(
-                    f"Timeout waiting for averaging to complete (WAIT ON)"
-                )
-            
-            time.sleep(0.1)
-
-        # Acquire the completed averaged trace
-        trace = self.acquire_trace()
-
-        # Release WAIT state for next acquisition
-        self.set_wait_off()
-
-        log.info("Averaged trace acquisition complete")
-        return trace
-    
     def run(self):
         log.info("Starting system RUN sequence")
         self.set_laser_on()
@@ -0,0 +1,183 @@
+import json
+from datetime import datetime
+
+import h5py
+import numpy as np
+import pytest
+
+from teracontrol.core.data import DataAtom, Waveform
+from teracontrol.engines.hdf5_writer import HDF5RunWriter, dumps
+
+
+NT = 64
+T0 = 100.0
+DT = 0.05
+
+
+def make_atom(index: int, time: np.ndarray) -> DataAtom:
+    return DataAtom(
+        timestamp=datetime.now().astimezone().isoformat(),
+        status={"TeraFlash": {"amplitude_nA": 1.5 * index, "ok": None}},
+        payload=Waveform(time=time, signal=np.sin(time) * index),
+        index=index,
+    )
+
+
+def write_run(path, times, **kwargs) -> None:
+    writer = HDF5RunWriter(path, **kwargs)
+    writer.open({"axis": "count", "start": 1}, {"operator": "me"})
+    for index, time in enumerate(times, start=1):
+        writer.write(index, make_atom(index, time))
+    writer.close()
+
+
+@pytest.fixture
+def time_axis() -> np.ndarray:
+    return T0 + DT * np.arange(NT)
+
+
+def test_signal_rows_round_trip(tmp_path, time_axis):
+    path = tmp_path / "run.h5"
+    write_run(path, [time_axis] * 3)
+
+    with h5py.File(path, "r") as f:
+        run = f["run"]
+        assert run.attrs["run.status"] == "completed"
+        assert run.attrs["user.operator"] == "me"
+
+        signal = run["data/signal"]
+        assert signal.shape == (3, NT)
+        assert signal.dtype == np.float32
+        assert signal.attrs["time.t0"] == pytest.approx(T0)
+        assert signal.attrs["time.dt"] == pytest.approx(DT)
+        assert signal.attrs["time.nt"] == NT
+        for row in range(3):
+            np.testing.assert_allclose(
+                signal[row], np.sin(time_axis) * (row + 1),
+                rtol=1e-6, atol=1e-6,
+            )
+
+
+def test_duplicate_index_is_rejected(tmp_path, time_axis):
+    writer = HDF5RunWriter(tmp_path / "run.h5")
+    writer.open({"axis": "count"}, {"operator": "me"})
+    try:
+        writer.write(1, make_atom(1, time_axis))
+        with pytest.raises(RuntimeError):
+            writer.write(1, make_atom(1, time_axis))
+    finally:
+        writer.close()
+
+
+def test_length_mismatch_is_rejected(tmp_path, time_axis):
+    writer = HDF5RunWriter(tmp_path / "run.h5")
+    writer.open({"axis": "count"}, {"operator": "me"})
+    try:
+        writer.write(1, make_atom(1, time_axis))
+        with pytest.raises(ValueError):
+            writer.write(2, make_atom(2, time_axis[:-1]))
+    finally:
+        writer.close()
+
+
+def test_meta_records(tmp_path, time_axis):
+    path = tmp_path / "run.h5"
+    write_run(path, [time_axis] * 3)
+
+    with h5py.File(path, "r") as f:
+        meta = f["run/data/meta"][...]
+        assert meta.shape == (3,)
+        assert meta["index"].tolist() == [1, 2, 3]
+        assert meta["time_uniform"].all()
+        assert json.loads(meta["status"][1]) == {
+            "TeraFlash": {"amplitude_nA": 3.0, "ok": None}
+        }
+        datetime.fromisoformat(meta["timestamp"][0].decode())
+
+
+def test_meta_storage_stays_small(tmp_path, time_axis):
+    path = tmp_path / "run.h5"
+    write_run(path, [time_axis] * 3)
+
+    with h5py.File(path, "r") as f:
+        meta = f["run/data/meta"]
+        assert meta.chunks == (HDF5RunWriter.META_CHUNK_ROWS,)
+        assert meta.id.get_storage_size() < 64_000
+
+
+def test_irregular_rows_get_an_explicit_time_axis(tmp_path, time_axis):
+    path = tmp_path / "run.h5"
+    shifted = time_axis.copy()
+    shifted[10] += 1.0  # off the shared axis, past the first two samples
+    write_run(
+        path, [time_axis, shifted, time_axis], assume_uniform_time=False
+    )
+
+    with h5py.File(path, "r") as f:
+        data = f["run/data"]
+        assert data["meta"]["time_uniform"].tolist() == [True, False, True]
+
+        # Only the irregular row carries an explicit axis
+        time = data["time"][...]
+        assert time.shape == (3, NT)
+        np.testing.assert_array_equal(time[1], shifted)
+        assert np.isnan(time[0]).all() and np.isnan(time[2]).all()
+
+
+def test_uniform_run_has_no_time_table(tmp_path, time_axis):
+    path = tmp_path / "run.h5"
+    write_run(path, [time_axis] * 2)
+
+    with h5py.File(path, "r") as f:
+        assert "time" not in f["run/data"]
+
+
+def test_float64_writer_keeps_full_precision(tmp_path, time_axis):
+    path = tmp_path / "run.h5"
+    write_run(path, [time_axis], dtype=np.float64)
+
+    with h5py.File(path, "r") as f:
+        signal = f["run/data/signal"]
+        assert signal.dtype == np.float64
+        np.testing.assert_array_equal(signal[0], np.sin(time_axis))
+
+
+def test_small_run_makes_a_small_file(tmp_path, time_axis):
+    path = tmp_path / "run.h5"
+    write_run(path, [time_axis] * 3)
+
+    assert path.stat().st_size < 256 * 1024
+
+
+@pytest.mark.parametrize(
+    "value, encoded",
+    [
+        ({"a": 1.5, "b": None, "c": "x"}, '{"a":1.5,"b":null,"c":"x"}'),
+        ({"a": np.int64(5), "b": np.float32(0.5)}, '{"a":5,"b":0.5}'),
+        ({"a": np.bool_(True)}, '{"a":true}'),
+        ({"a": np.arange(3)}, '{"a":[0,1,2]}'),
+        ({"a": float("nan"), "b": np.float64("-inf")}, '{"a":NaN,"b":-Infinity}'),
+        ({"a": "Probe DB8 \u00b0"}, '{"a":"Probe DB8 \u00b0"}'),
+        ({"a": datetime(2026, 1, 2)}, '{"a":"2026-01-02 00:00:00"}'),
+    ],
+)
+def test_dumps_encoding(value, encoded):
+    assert dumps(value) == encoded
+
+
+def test_non_finite_readings_survive_in_status(tmp_path, time_axis):
+    path = tmp_path / "run.h5"
+    atom = DataAtom(
+        timestamp=datetime.now().astimezone().isoformat(),
+        status={"ITC": {"reading_K": float("nan")}},
+        payload=Waveform(time=time_axis, signal=np.sin(time_axis)),
+        index=1,
+    )
+    writer = HDF5RunWriter(path)
+    writer.open({"axis": "count"}, {"operator": "me"})
+    writer.write(1, atom)
+    writer.close()
+
+    with h5py.File(path, "r") as f:
+        status = json.loads(f["run/data/meta"]["status"][0])
+        assert np.isnan(status["ITC"]["reading_K"])
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from teracontrol.core.data import Waveform, waveform_to_wavespectrum
+from teracontrol.core.data.data import waveforms_to_wavespectra
+
+
+def make_waveforms(n: int, nt: int = 256) -> list[Waveform]:
+    rng = np.random.default_rng(0)
+    time = 0.05 * np.arange(nt)
+    return [
+        Waveform(time=time, signal=np.sin(time * (i + 1)) + rng.normal(size=nt))
+        for i in range(n)
+    ]
+
+
+def test_spectrum_matches_full_fft():
+    wf = make_waveforms(1)[0]
+
+    spectrum = waveform_to_wavespectrum(wf, length=512)
+    full = np.fft.fft(wf.signal, n=512)[:256]
+
+    np.testing.assert_allclose(
+        spectrum.freq, np.fft.fftfreq(512, 0.05)[:256], rtol=1e-6
+    )
+    np.testing.assert_allclose(spectrum.amp, np.abs(full), rtol=1e-4, atol=1e-3)
+
+
+def test_frequency_axis_is_shared_and_read_only():
+    first, second = (waveform_to_wavespectrum(wf) for wf in make_waveforms(2))
+
+    assert first.freq is second.freq
+    assert not first.freq.flags.writeable
+
+
+@pytest.mark.parametrize(
+    "t_cut, length", [(None, None), (8.0, None), (None, 1024), (8.0, 512)]
+)
+def test_batched_matches_single(t_cut, length):
+    waveforms = make_waveforms(4)
+
+    batched = waveforms_to_wavespectra(waveforms, t_cut, length)
+    single = [waveform_to_wavespectrum(wf, t_cut, length) for wf in waveforms]
+
+    assert len(batched) == len(single)
+    for b, s in zip(batched, single):
+        np.testing.assert_array_equal(b.freq, s.freq)
+        np.testing.assert_allclose(b.amp, s.amp, rtol=1e-5, atol=1e-4)
+        np.testing.assert_allclose(b.phase, s.phase, rtol=1e-5, atol=1e-4)
+
+
+def test_mismatched_time_axes_fall_back():
+    waveforms = make_waveforms(3)
+    shifted = Waveform(time=waveforms[0].time + 1.0, signal=waveforms[0].signal)
+    waveforms.append(shifted)
+
+    batched = waveforms_to_wavespectra(waveforms)
+    single = [waveform_to_wavespectrum(wf) for wf in waveforms]
+
+    for b, s in zip(batched, single):
+        np.testing.assert_array_equal(b.amp, s.amp)
+
+
+def test_waveform_keeps_source_precision():
+    wf = make_waveforms(1)[0]
+
+    assert wf.signal.dtype == np.float64
+    assert wf.signal.flags.c_contiguous
+    assert waveform_to_wavespectrum(wf).amp.dtype == np.float32
@@ -0,0 +1,31 @@
+import pytest
+
+from teracontrol.core.experiment.sweep_axis import CountAxis
+from teracontrol.core.experiment.sweep_config import SweepConfig
+
+
+@pytest.mark.parametrize(
+    "start, stop, step, npoints",
+    [
+        (0.0, 1.0, 0.1, 11),  # 1.0 / 0.1 = 9.999... in floating point
+        (0.0, 0.3, 0.1, 4),
+        (1.0, 10.0, 1.0, 10),
+        (0.0, 0.95, 0.1, 10),  # stop between grid points
+        (1.0, 0.0, -0.1, 11),
+        (2.0, 2.0, 0.5, 1),
+    ],
+)
+def test_npoints_includes_stop_on_grid(start, stop, step, npoints):
+    config = SweepConfig(axis=CountAxis(), start=start, stop=stop, step=step)
+
+    assert config.npoints() == npoints
+    assert len(config.points()) == npoints
+
+
+def test_points_do_not_accumulate_roundoff():
+    config = SweepConfig(axis=CountAxis(), start=0.0, stop=1.0, step=0.1)
+    points = config.points()
+
+    assert points[0] == 0.0
+    assert points[-1] == pytest.approx(1.0, abs=1e-12)
+    assert points[3] == 3 * 0.1